@@ -7,28 +7,70 @@
 #
 # dKI Assessment Tool
 
+import functools
 import json
 import sys
 import os
 
+# orjson is an optional C JSON codec; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# key strings used against the JSON config dicts, built once
+SCHEME_KEYS = tuple(f"scheme{i}" for i in range(1, 7))
+ADJUSTMENT_KEYS = tuple(f"{key}_adjustments" for key in SCHEME_KEYS)
+
+# weighting index for every (r1, r2, r3) stage-2 combination, indexed by
+# (r1 << 2) | (r2 << 1) | r3; keep in sync with WEIGHTING_LUT in montecarlo.py
+WEIGHTING_LUT = (0, 3, 2, 3, 1, 3, 2, 3)
+
+# per-criterion (sign, offset): negative criteria D and E enter the weighted
+# sum inverted as (7 - score), i.e. offset + sign * score
+CRITERION_SIGN_OFFSETS = (
+    ("criterionA", 1, 0),
+    ("criterionB", 1, 0),
+    ("criterionC", 1, 0),
+    ("criterionD", -1, 7),
+    ("criterionE", -1, 7),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json(path):
+    """load one of the small JSON config files, cached per path"""
+    # parse from a bytes buffer; orjson decodes in C when it is installed
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(path, data):
+    """write a JSON document, using orjson's C encoder when it is installed"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
 
 class DKIAssessment:
     def __init__(self):
-        # load data from JSON files
-        with open("schemes.json", "r") as f:
-            self.schemes = json.load(f)
-
-        with open("criteria.json", "r") as f:
-            self.criteria = json.load(f)
-
-        with open("weightings.json", "r") as f:
-            self.weightings = json.load(f)
-
-        with open("baseline_scheme_scores.json", "r") as f:
-            self.baseline_scores = json.load(f)
-
-        with open("stage3_questions.json", "r") as f:
-            self.stage3_questions = json.load(f)
+        # load data from JSON files (cached at module level)
+        self.schemes = _load_json("schemes.json")
+        self.criteria = _load_json("criteria.json")
+        self.weightings = _load_json("weightings.json")
+        self.baseline_scores = _load_json("baseline_scheme_scores.json")
+        self.stage3_questions = _load_json("stage3_questions.json")
 
         # initialize variables
         self.criteria_rankings = {}
@@ -68,28 +110,25 @@ class DKIAssessment:
         )
         print("Each ranking may only be used once.\n")
 
-        used_rankings = set()
-        for criterion in ["A", "B", "C", "D", "E"]:
-            while True:
-                try:
-                    ranking = int(
-                        input(
-                            f"Ranking for criterion {criterion} ({self.criteria_map[criterion]}): "
-                        )
-                    )
-                    if ranking < 1 or ranking > 5:
-                        print("Please enter a number between 1 and 5.")
-                        continue
-                    if ranking in used_rankings:
-                        print(
-                            "This ranking has already been used. Please choose another."
-                        )
-                        continue
-                    used_rankings.add(ranking)
-                    self.criteria_rankings[criterion] = ranking
-                    break
-                except ValueError:
-                    print("Please enter a valid number.")
+        criteria = ["A", "B", "C", "D", "E"]
+        for criterion in criteria:
+            print(f"Criterion {criterion}: {self.criteria_map[criterion]}")
+
+        while True:
+            response = input(
+                "\nEnter the rankings for criteria A,B,C,D,E as five comma-separated values: "
+            )
+            try:
+                rankings = [int(part) for part in response.split(",")]
+            except ValueError:
+                print("Please enter five valid numbers separated by commas.")
+                continue
+            if sorted(rankings) != [1, 2, 3, 4, 5]:
+                print("Please use each ranking between 1 and 5 exactly once.")
+                continue
+            for criterion, ranking in zip(criteria, rankings):
+                self.criteria_rankings[criterion] = ranking
+            break
 
     def stage2_context_questions(self):
         """execute stage 2: Organization context questions"""
@@ -113,45 +152,12 @@ class DKIAssessment:
                     print("Please enter 'y' or 'n'.")
 
         # determine the weighting based on the responses
-        if not any(self.stage2_responses.values()):
-            # no yes responses or checkboxes ticked
-            self.selected_weighting = "weighting0"
-        elif (
-            self.stage2_responses[1]
-            and not self.stage2_responses[2]
-            and not self.stage2_responses[3]
-        ):
-            # yes response to question 1 or only checkbox 1 is ticked
-            self.selected_weighting = "weighting1"
-        elif (
-            self.stage2_responses[2]
-            and not self.stage2_responses[1]
-            and not self.stage2_responses[3]
-        ):
-            # yes response to question 2 or only checkbox 2 is ticked
-            self.selected_weighting = "weighting2"
-        elif (
-            self.stage2_responses[3]
-            and not self.stage2_responses[1]
-            and not self.stage2_responses[2]
-        ):
-            # yes response to question 3 or only checkbox 3 is ticked
-            self.selected_weighting = "weighting3"
-        elif (
-            self.stage2_responses[1]
-            and self.stage2_responses[2]
-            and not self.stage2_responses[3]
-        ):
-            # yes responses to questions 1 and 2 or checkboxes 1 and 2 are ticked
-            self.selected_weighting = "weighting2"
-        elif self.stage2_responses[3] and (
-            self.stage2_responses[1] or self.stage2_responses[2]
-        ):
-            # yes response to one of questions 1 or 2 and yes response to question 3 or combination of (checkboxes 1 or 2) and checkbox 3
-            self.selected_weighting = "weighting3"
-        elif all(self.stage2_responses.values()):
-            # yes response to all three questions or all three checkboxes are ticked
-            self.selected_weighting = "weighting3"
+        index = (
+            (self.stage2_responses[1] << 2)
+            | (self.stage2_responses[2] << 1)
+            | self.stage2_responses[3]
+        )
+        self.selected_weighting = f"weighting{WEIGHTING_LUT[index]}"
 
     def stage3_additional_questions(self):
         """execute stage 3: Additional yes/no questions"""
@@ -221,9 +227,7 @@ class DKIAssessment:
         for question in self.stage3_questions:
             q_num = question["stage3_question_number"]
             if q_num in self.stage3_responses and self.stage3_responses[q_num] == "y":
-                for scheme_id in range(1, 7):
-                    scheme_key = f"scheme{scheme_id}"
-                    adjustments_key = f"{scheme_key}_adjustments"
+                for scheme_key, adjustments_key in zip(SCHEME_KEYS, ADJUSTMENT_KEYS):
                     if adjustments_key in question:
                         for criterion, adjustment in question[adjustments_key].items():
                             curr_value = adjusted_scores[scheme_key][criterion]
@@ -231,30 +235,15 @@ class DKIAssessment:
                                 1, min(6, curr_value + adjustment)
                             )
 
-        # calculate final weighted scores
-        for scheme_id in range(1, 7):
-            scheme_key = f"scheme{scheme_id}"
-
+        # calculate final weighted scores; the weighting dict is the same for
+        # every scheme and criterion, so look it up once
+        weights = self.weightings[self.selected_weighting]
+        for scheme_key in SCHEME_KEYS:
             # calculate the weighted scores for each criterion
             weighted_score = 0
-            for criterion in [
-                "criterionA",
-                "criterionB",
-                "criterionC",
-                "criterionD",
-                "criterionE",
-            ]:
-                criterion_short = criterion[-1]  # Extract just the letter
+            for criterion, sign, offset in CRITERION_SIGN_OFFSETS:
                 raw_score = adjusted_scores[scheme_key][criterion]
-                weight = self.weightings[self.selected_weighting][criterion]
-
-                # for negative criteria (D, E), invert the score (7 - score)
-                if criterion_short in ["D", "E"]:
-                    criterion_score = (7 - raw_score) * weight
-                else:
-                    criterion_score = raw_score * weight
-
-                weighted_score += criterion_score
+                weighted_score += (offset + sign * raw_score) * weights[criterion]
 
             self.final_scores[scheme_key] = {
                 "name": self.schemes[scheme_key],
@@ -280,8 +269,7 @@ class DKIAssessment:
         }
 
         # write the data to a JSON file
-        with open(filename, "w") as f:
-            json.dump(assessment_data, f, indent=4)
+        _dump_json(filename, assessment_data)
 
         print(f"\nAssessment data saved to {filename}")
 
@@ -9,229 +9,398 @@
 # invoke with 'montecarlo.py --trials <NUMBER_OF_TRIALS>'
 
 
+import concurrent.futures
+import functools
 import json
-import random
+import multiprocessing
 import time
 import os
-import copy
-from collections import Counter
 
+import numpy as np
+
+# orjson is an optional C JSON codec; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numba is an optional accelerator; the NumPy kernel is used when it is absent
+try:
+    import numba
+
+    prange = numba.prange
+except ImportError:
+    numba = None
+    prange = range
+
+# cupy is an optional GPU accelerator with a NumPy-compatible API; batches
+# below this size are not worth the host-to-device transfer
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+GPU_MIN_TRIALS = 1_000_000
+
+# each spawned worker pays a full interpreter + numpy/numba import before it
+# scores anything, so the pool only pays off for large runs
+POOL_MIN_TRIALS = 100_000
+
+
+# key strings used against the JSON config dicts, built once
+SCHEME_KEYS = tuple(f"scheme{i}" for i in range(1, 7))
+ADJUSTMENT_KEYS = tuple(f"{key}_adjustments" for key in SCHEME_KEYS)
+CRITERION_KEYS = tuple(f"criterion{c}" for c in "ABCDE")
+WEIGHTING_KEYS = tuple(f"weighting{i}" for i in range(4))
+
+# weighting index for every (r1, r2, r3) stage-2 combination, indexed by
+# (r1 << 2) | (r2 << 1) | r3; enumerates the decision tree used in assessment.py
+WEIGHTING_LUT = np.array([0, 3, 2, 3, 1, 3, 2, 3], dtype=np.int8)
+
+
+def _score_all(
+    stage2, stage3_yes, baseline, adjustments, weights, signs, offsets, weighting_lut
+):
+    """JIT-compiled scoring loop over all trials (used when numba is available)"""
+    num_trials = stage2.shape[0]
+    num_questions = stage3_yes.shape[1]
+    winners = np.empty(num_trials, dtype=np.int64)
+    weighting_indices = np.empty(num_trials, dtype=np.int64)
+
+    for t in prange(num_trials):
+        # determine the weighting from the stage-2 responses
+        w_idx = weighting_lut[stage2[t, 0] * 4 + stage2[t, 1] * 2 + stage2[t, 2]]
+
+        # adjust, clip, weight, and accumulate per scheme; track the winner
+        best_score = -1.0
+        best_scheme = 0
+        for s in range(6):
+            weighted_score = 0.0
+            for c in range(5):
+                adjusted = baseline[s, c]
+                for q in range(num_questions):
+                    if stage3_yes[t, q]:
+                        adjusted += adjustments[q, s, c]
+                        # clip after every question, matching assessment.py
+                        if adjusted < 1:
+                            adjusted = 1
+                        elif adjusted > 6:
+                            adjusted = 6
+                weighted_score += (offsets[c] + signs[c] * adjusted) * weights[w_idx, c]
+            if weighted_score > best_score:
+                best_score = weighted_score
+                best_scheme = s
+        winners[t] = best_scheme
+        weighting_indices[t] = w_idx
+
+    return winners, weighting_indices
+
+
+# every shape in the kernel is fixed by the config (5 criteria, 6 schemes,
+# 9 questions, 4 weightings), so compile one concrete signature eagerly at
+# import; cache=True persists the compiled binary so the warmup is paid once
+_SCORE_ALL_SIGNATURE = (
+    "UniTuple(i8[:], 2)"
+    "(i1[:, :], i1[:, :], i1[:, :], i1[:, :, :], f8[:, :], i1[:], i1[:], i1[:])"
+)
+
+# no fastmath: the winner argmax must resolve score ties exactly like the
+# float64 reductions in the NumPy and cupy paths, whichever backend is used
+if numba is not None:
+    _score_all = numba.njit(_SCORE_ALL_SIGNATURE, cache=True, parallel=True)(
+        _score_all
+    )
 
-class DKIMonteCarloSimulation:
-    def __init__(self, num_trials=1000):
-        # load data from JSON files
-        with open("schemes.json", "r") as f:
-            self.schemes = json.load(f)
 
-        with open("criteria.json", "r") as f:
-            self.criteria = json.load(f)
+@functools.lru_cache(maxsize=None)
+def _load_json(path):
+    """load one of the small JSON config files, cached per path"""
+    # parse from a bytes buffer; orjson decodes in C when it is installed
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(path, data):
+    """write a JSON document, using orjson's C encoder when it is installed"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
 
-        with open("weightings.json", "r") as f:
-            self.weightings = json.load(f)
+def _run_chunk(seed_sequence, chunk_size):
+    """worker: draw and score one chunk of trials with an independent rng"""
+    simulation = DKIMonteCarloSimulation(num_trials=chunk_size)
+    rng = np.random.default_rng(seed_sequence)
+    return simulation._draw_and_score(rng, chunk_size)
 
-        with open("baseline_scheme_scores.json", "r") as f:
-            self.baseline_scores = json.load(f)
 
-        with open("stage3_questions.json", "r") as f:
-            self.stage3_questions = json.load(f)
+class DKIMonteCarloSimulation:
+    def __init__(self, num_trials=1000, workers=None, save_trials=False):
+        # load data from JSON files (cached at module level)
+        self.schemes = _load_json("schemes.json")
+        self.criteria = _load_json("criteria.json")
+        self.weightings = _load_json("weightings.json")
+        self.baseline_scores = _load_json("baseline_scheme_scores.json")
+        self.stage3_questions = _load_json("stage3_questions.json")
 
         # initialize variables
         self.num_trials = num_trials
-        self.results = []
+        self.workers = workers if workers is not None else os.cpu_count()
+        self.save_trials = save_trials
+
+        # per-trial outcomes: winner and weighting indices, filled by the kernel
+        self._winners = np.empty(0, dtype=np.int8)
+        self._weightings = np.empty(0, dtype=np.int8)
+
+        # GPU copies of the scoring tensors, uploaded on first use
+        self._gpu_tensors = None
 
         # create a dictionary to map criteria codes to names
         self.criteria_map = {item["code"]: item["name"] for item in self.criteria}
 
+        # precompute dense tensors for the vectorized scoring kernel:
+        # weights indexed by (weighting, criterion) and baseline scores
+        # indexed by (scheme, criterion)
+        self._weights = np.array(
+            [
+                [self.weightings[wtg][crit] for crit in CRITERION_KEYS]
+                for wtg in WEIGHTING_KEYS
+            ],
+            dtype=np.float64,
+        )
+        self._baseline = np.array(
+            [
+                [self.baseline_scores[scheme][crit] for crit in CRITERION_KEYS]
+                for scheme in SCHEME_KEYS
+            ],
+            dtype=np.int8,
+        )
+
+        # for negative criteria (D, E), the score enters as (7 - raw),
+        # i.e. offset + sign * raw
+        self._signs = np.array([1, 1, 1, -1, -1], dtype=np.int8)
+        self._offsets = np.array([0, 0, 0, 7, 7], dtype=np.int8)
+
+        # (question, scheme, criterion) adjustment tensor, built once from the JSON
+        num_questions = len(self.stage3_questions)
+        self._adjustments = np.zeros((num_questions, 6, 5), dtype=np.int8)
+        for q_idx, question in enumerate(self.stage3_questions):
+            for s_idx, adjustments_key in enumerate(ADJUSTMENT_KEYS):
+                if adjustments_key in question:
+                    for c_idx, criterion_key in enumerate(CRITERION_KEYS):
+                        self._adjustments[q_idx, s_idx, c_idx] = question[
+                            adjustments_key
+                        ].get(criterion_key, 0)
+
     def run_simulation(self):
         """run the Monte Carlo simulation"""
-        print(f"Running {self.num_trials} simulations...")
+        # small runs stay single-process: the vectorized kernel finishes them
+        # faster than the pool can even start its workers
+        workers = self.workers if self.num_trials >= POOL_MIN_TRIALS else 1
+
+        print(f"Running {self.num_trials} simulations on {workers} worker(s)...")
         start_time = time.time()
 
-        for trial in range(self.num_trials):
-            result = self.run_single_trial()
-            if result:  # only add if not aborted
-                self.results.append(result)
-
-            # print progress every 10% of trials
-            if (trial + 1) % max(1, self.num_trials // 10) == 0:
-                progress = (trial + 1) / self.num_trials * 100
-                elapsed = time.time() - start_time
-                print(
-                    f"Progress: {progress:.1f}% ({trial + 1}/{self.num_trials}), Elapsed time: {elapsed:.2f}s"
-                )
+        if workers > 1:
+            # trials are independent: split them into one chunk per worker,
+            # each with its own child seed, and concatenate the outcomes
+            base, extra = divmod(self.num_trials, workers)
+            chunk_sizes = [base + (i < extra) for i in range(workers)]
+            seeds = np.random.SeedSequence().spawn(len(chunk_sizes))
+            # spawn rather than fork: numba's parallel threading state is
+            # not fork-safe, and the eager kernel reloads from its disk cache
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                chunks = list(pool.map(_run_chunk, seeds, chunk_sizes))
+            self._winners = np.concatenate([winners for winners, _ in chunks])
+            self._weightings = np.concatenate([weightings for _, weightings in chunks])
+        else:
+            rng = np.random.default_rng()
+            self._winners, self._weightings = self._draw_and_score(
+                rng, self.num_trials
+            )
+
+        elapsed = time.time() - start_time
+        print(
+            f"Scored {len(self._winners)}/{self.num_trials} valid trials in {elapsed:.2f}s"
+        )
+
+        # optionally stream the per-trial outcomes to disk
+        if self.save_trials:
+            self.stream_trials_to_ndjson()
 
         # analyze and print results
         self.analyze_results()
 
-    def run_single_trial(self):
-        """run a single trial with randomized responses"""
-        # initialize trial data
-        criteria_rankings = {}
-        stage2_responses = {1: False, 2: False, 3: False}
-        stage3_responses = {}
+    def stream_trials_to_ndjson(self):
+        """stream one JSON line per trial to disk instead of keeping dicts in RAM"""
+        timestamp = int(time.time())
+        filename = f"dKI_montecarlo_{self.num_trials}_{timestamp}.ndjson"
+
+        # a large write buffer batches the line writes into few syscalls
+        with open(filename, "w", buffering=1 << 20) as f:
+            for winner, weighting_idx in zip(
+                self._winners.tolist(), self._weightings.tolist()
+            ):
+                f.write(
+                    json.dumps(
+                        {
+                            "winning_scheme": SCHEME_KEYS[winner],
+                            "selected_weighting": WEIGHTING_KEYS[weighting_idx],
+                        },
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                )
+
+        print(f"Per-trial results streamed to {filename}")
 
-        # Stage 1: random criteria rankings (1-5, each used once)
-        rankings = list(range(1, 6))
-        random.shuffle(rankings)
-        for i, criterion in enumerate(["A", "B", "C", "D", "E"]):
-            criteria_rankings[criterion] = rankings[i]
+    def _draw_and_score(self, rng, num_trials):
+        """draw random responses for a block of trials and score them"""
+        num_questions = len(self.stage3_questions)
+
+        # Stage 1 rankings are not drawn: they never influence the scoring,
+        # and nothing consumes them since per-trial result dicts were dropped
 
         # Stage 2: random context responses
-        for i in range(1, 4):
-            stage2_responses[i] = random.choice([True, False])
-
-        # determine the weighting based on the responses
-        if not any(stage2_responses.values()):
-            # no yes responses or checkboxes ticked
-            selected_weighting = "weighting0"
-        elif (
-            stage2_responses[1] and not stage2_responses[2] and not stage2_responses[3]
-        ):
-            # yes response to question 1 or only checkbox 1 is ticked
-            selected_weighting = "weighting1"
-        elif (
-            stage2_responses[2] and not stage2_responses[1] and not stage2_responses[3]
-        ):
-            # yes response to question 2 or only checkbox 2 is ticked
-            selected_weighting = "weighting2"
-        elif (
-            stage2_responses[3] and not stage2_responses[1] and not stage2_responses[2]
-        ):
-            # yes response to question 3 or only checkbox 3 is ticked
-            selected_weighting = "weighting3"
-        elif stage2_responses[1] and stage2_responses[2] and not stage2_responses[3]:
-            # yes responses to questions 1 and 2 or checkboxes 1 and 2 are ticked
-            selected_weighting = "weighting2"
-        elif stage2_responses[3] and (stage2_responses[1] or stage2_responses[2]):
-            # yes response to one of questions 1 or 2 and yes response to question 3 or combination of (checkboxes 1 or 2) and checkbox 3
-            selected_weighting = "weighting3"
-        elif all(stage2_responses.values()):
-            # yes response to all three questions or all three checkboxes are ticked
-            selected_weighting = "weighting3"
-
-        # Stage 3: Random yes/no/not sure responses
-        # randomly decide how many "not sure" responses (0, 1, or 2)
-        not_sure_count = random.choice([0, 1, 2])
-
-        # randomly select which questions will be "not sure"
-        if not_sure_count > 0:
-            not_sure_questions = random.sample(
-                range(1, len(self.stage3_questions) + 1), not_sure_count
+        stage2 = rng.integers(0, 2, size=(num_trials, 3), dtype=np.int8)
+
+        # Stage 3: randomly decide how many "not sure" responses (0, 1, or 2)
+        # per trial, then mark that many random question positions as "not sure"
+        not_sure_count = rng.integers(0, 3, size=num_trials)
+        position_ranks = rng.random((num_trials, num_questions)).argsort(axis=1).argsort(axis=1)
+        not_sure = position_ranks < not_sure_count[:, None]
+
+        # random yes/no answers for the remaining questions
+        yes_no = rng.integers(0, 2, size=(num_trials, num_questions), dtype=np.int8)
+
+        # check if at least 77% (7/9 rounded down) of questions have definite answers
+        definite_answers = num_questions - not_sure.sum(axis=1)
+        valid = definite_answers >= 0.77 * num_questions
+
+        # a question counts as "yes" only if it was answered and the answer was y
+        stage3_yes = yes_no & ~not_sure
+
+        # score all valid trials in one batched kernel call; keep only the two
+        # index arrays per trial -- names are resolved at print time
+        winners, weighting_indices = self._score_batch(stage2[valid], stage3_yes[valid])
+        return winners.astype(np.int8), weighting_indices.astype(np.int8)
+
+    def _score_batch(self, stage2, stage3_yes):
+        """score a whole batch of trials with the precomputed tensors"""
+        # very large batches go to the GPU when cupy is available
+        if cp is not None and len(stage2) >= GPU_MIN_TRIALS:
+            return self._score_batch_gpu(stage2, stage3_yes)
+
+        # hand the whole batch to the JIT-compiled loop when numba is available
+        if numba is not None:
+            return _score_all(
+                stage2,
+                stage3_yes,
+                self._baseline,
+                self._adjustments,
+                self._weights,
+                self._signs,
+                self._offsets,
+                WEIGHTING_LUT,
             )
-        else:
-            not_sure_questions = []
-
-        for question in self.stage3_questions:
-            q_num = question["stage3_question_number"]
-            if q_num in not_sure_questions:
-                stage3_responses[q_num] = "not sure"
-            else:
-                stage3_responses[q_num] = random.choice(["y", "n"])
-
-        # check if at least 77% (7/9 rounded down)of questions have definite answers
-        definite_answers = sum(
-            1 for response in stage3_responses.values() if response in ["y", "n"]
+
+        # determine the weighting for every trial via the lookup table
+        weighting_indices = WEIGHTING_LUT[stage2 @ np.array([4, 2, 1], dtype=np.int8)]
+
+        # apply the adjustments for every "yes" answer, clipped to the 1-6 range
+        # apply the questions in order and clip to 1..6 after each one, the
+        # same sequential clamping assessment.py does; batched over trials
+        adjusted = np.tile(self._baseline, (len(stage3_yes), 1, 1))
+        for q_idx in range(stage3_yes.shape[1]):
+            adjusted += stage3_yes[:, q_idx, None, None] * self._adjustments[q_idx]
+            np.clip(adjusted, 1, 6, out=adjusted)
+
+        # negative criteria enter as (7 - score); weight and sum per scheme
+        effective = self._offsets + self._signs * adjusted
+        weighted = (effective * self._weights[weighting_indices][:, None, :]).sum(
+            axis=2
         )
-        total_questions = len(self.stage3_questions)
-
-        if definite_answers < 0.77 * total_questions:
-            # assessment would be aborted, skip this trial
-            return None
-
-        # calculate final scores
-        adjusted_scores = {}
-        for scheme_id, scheme_scores in self.baseline_scores.items():
-            adjusted_scores[scheme_id] = scheme_scores.copy()
-
-        # apply adjustments based on Stage 3 responses
-        for question in self.stage3_questions:
-            q_num = question["stage3_question_number"]
-            if q_num in stage3_responses and stage3_responses[q_num] == "y":
-                for scheme_id in range(1, 7):
-                    scheme_key = f"scheme{scheme_id}"
-                    adjustments_key = f"{scheme_key}_adjustments"
-                    if adjustments_key in question:
-                        for criterion, adjustment in question[adjustments_key].items():
-                            curr_value = adjusted_scores[scheme_key][criterion]
-                            adjusted_scores[scheme_key][criterion] = max(
-                                1, min(6, curr_value + adjustment)
-                            )
-
-        # calculate final weighted scores
-        final_scores = {}
-        for scheme_id in range(1, 7):
-            scheme_key = f"scheme{scheme_id}"
-
-            # calculate the weighted scores for each criterion
-            weighted_score = 0
-            for criterion in [
-                "criterionA",
-                "criterionB",
-                "criterionC",
-                "criterionD",
-                "criterionE",
-            ]:
-                criterion_short = criterion[-1]  # Extract just the letter
-                raw_score = adjusted_scores[scheme_key][criterion]
-                weight = self.weightings[selected_weighting][criterion]
-
-                # for negative criteria (D, E), invert the score (7 - score)
-                if criterion_short in ["D", "E"]:
-                    criterion_score = (7 - raw_score) * weight
-                else:
-                    criterion_score = raw_score * weight
-
-                weighted_score += criterion_score
-
-            final_scores[scheme_key] = {
-                "name": self.schemes[scheme_key],
-                "adjusted_scores": adjusted_scores[scheme_key],
-                "weighted_score": weighted_score,
-            }
-
-        # determine the winning scheme
-        ranked_schemes = sorted(
-            final_scores.items(), key=lambda x: x[1]["weighted_score"], reverse=True
+
+        # determine the winning scheme per trial
+        winners = weighted.argmax(axis=1)
+
+        return winners, weighting_indices
+
+    def _score_batch_gpu(self, stage2, stage3_yes):
+        """score a batch on the GPU; same array expressions as the NumPy path"""
+        # upload the static tensors once per instance
+        if self._gpu_tensors is None:
+            self._gpu_tensors = (
+                cp.asarray(self._baseline),
+                cp.asarray(self._adjustments),
+                cp.asarray(self._weights),
+                cp.asarray(self._signs),
+                cp.asarray(self._offsets),
+                cp.asarray(WEIGHTING_LUT),
+            )
+        baseline, adjustments, weights, signs, offsets, weighting_lut = (
+            self._gpu_tensors
         )
-        winning_scheme = ranked_schemes[0][0]
-
-        return {
-            "criteria_rankings": criteria_rankings,
-            "stage2_responses": stage2_responses,
-            "selected_weighting": selected_weighting,
-            "stage3_responses": stage3_responses,
-            "final_scores": final_scores,
-            "winning_scheme": winning_scheme,
-            "winning_scheme_name": self.schemes[winning_scheme],
-        }
+
+        stage2 = cp.asarray(stage2)
+        stage3_yes = cp.asarray(stage3_yes)
+
+        weighting_indices = weighting_lut[stage2 @ cp.asarray([4, 2, 1])]
+
+        adjusted = cp.tile(baseline, (len(stage3_yes), 1, 1))
+        for q_idx in range(stage3_yes.shape[1]):
+            adjusted += stage3_yes[:, q_idx, None, None] * adjustments[q_idx]
+            cp.clip(adjusted, 1, 6, out=adjusted)
+
+        effective = offsets + signs * adjusted
+        weighted = (effective * weights[weighting_indices][:, None, :]).sum(axis=2)
+        winners = weighted.argmax(axis=1)
+
+        # download only the two small result arrays
+        return cp.asnumpy(winners), cp.asnumpy(weighting_indices)
 
     def analyze_results(self):
         """analyze and print the simulation results"""
-        if not self.results:
+        if len(self._winners) == 0:
             print("No valid results to analyze. All trials were aborted.")
             return
 
-        print(f"\nMONTE CARLO SIMULATION RESULTS ({len(self.results)} valid trials)")
+        num_valid = len(self._winners)
+        print(f"\nMONTE CARLO SIMULATION RESULTS ({num_valid} valid trials)")
 
-        # count winning schemes
-        scheme_counts = Counter(result["winning_scheme"] for result in self.results)
+        # count winning schemes in C with bincount
+        scheme_counts = np.bincount(self._winners, minlength=len(self.schemes))
 
         print("Winning scheme distribution:")
         print("-" * 60)
         print(f"{'Scheme':<30} | {'Count':<10} | {'Percentage':<10}")
         print("-" * 60)
 
-        for scheme_id in sorted(scheme_counts.keys()):
-            count = scheme_counts[scheme_id]
-            percentage = (count / len(self.results)) * 100
-            scheme_name = self.schemes[scheme_id]
+        for scheme_idx, count in enumerate(scheme_counts):
+            if count == 0:
+                continue
+            percentage = (count / num_valid) * 100
+            scheme_name = self.schemes[SCHEME_KEYS[scheme_idx]]
             print(f"{scheme_name:<30} | {count:<10} | {percentage:.2f}%")
 
         # check if any scheme was never selected
         never_selected = [
-            scheme_name
-            for scheme_id, scheme_name in self.schemes.items()
-            if scheme_id not in scheme_counts
+            self.schemes[SCHEME_KEYS[scheme_idx]]
+            for scheme_idx, count in enumerate(scheme_counts)
+            if count == 0
         ]
 
         if never_selected:
@@ -242,17 +411,18 @@ class DKIMonteCarloSimulation:
             print("\nAll schemes were selected at least once.")
 
         # count weightings distribution
-        weighting_counts = Counter(
-            result["selected_weighting"] for result in self.results
-        )
+        weighting_counts = np.bincount(self._weightings, minlength=len(self.weightings))
 
         print("\nWeighting distribution:")
         print("-" * 40)
         print(f"{'Weighting':<15} | {'Count':<10} | {'Percentage':<10}")
         print("-" * 40)
 
-        for weighting, count in weighting_counts.items():
-            percentage = (count / len(self.results)) * 100
+        for weighting_idx, count in enumerate(weighting_counts):
+            if count == 0:
+                continue
+            percentage = (count / num_valid) * 100
+            weighting = WEIGHTING_KEYS[weighting_idx]
             print(f"{weighting:<15} | {count:<10} | {percentage:.2f}%")
 
         # save results to file
@@ -263,45 +433,44 @@ class DKIMonteCarloSimulation:
         timestamp = int(time.time())
         filename = f"dKI_montecarlo_{self.num_trials}_{timestamp}.json"
 
-        # count winning schemes
-        scheme_counts = Counter(result["winning_scheme"] for result in self.results)
-        scheme_percentages = {
-            scheme: (count / len(self.results)) * 100
-            for scheme, count in scheme_counts.items()
-        }
-
-        # count weightings
-        weighting_counts = Counter(
-            result["selected_weighting"] for result in self.results
-        )
-        weighting_percentages = {
-            weighting: (count / len(self.results)) * 100
-            for weighting, count in weighting_counts.items()
-        }
+        # count winning schemes and weightings from the index arrays
+        num_valid = len(self._winners)
+        scheme_counts = np.bincount(self._winners, minlength=len(self.schemes))
+        weighting_counts = np.bincount(self._weightings, minlength=len(self.weightings))
 
-        # prepare summary data
+        # prepare summary data, mapping indices back to names
         summary_data = {
             "num_trials": self.num_trials,
-            "valid_trials": len(self.results),
+            "valid_trials": num_valid,
             "scheme_counts": {
-                self.schemes[scheme]: count for scheme, count in scheme_counts.items()
+                self.schemes[SCHEME_KEYS[idx]]: int(count)
+                for idx, count in enumerate(scheme_counts)
+                if count
             },
             "scheme_percentages": {
-                self.schemes[scheme]: percentage
-                for scheme, percentage in scheme_percentages.items()
+                self.schemes[SCHEME_KEYS[idx]]: (int(count) / num_valid) * 100
+                for idx, count in enumerate(scheme_counts)
+                if count
+            },
+            "weighting_counts": {
+                WEIGHTING_KEYS[idx]: int(count)
+                for idx, count in enumerate(weighting_counts)
+                if count
+            },
+            "weighting_percentages": {
+                WEIGHTING_KEYS[idx]: (int(count) / num_valid) * 100
+                for idx, count in enumerate(weighting_counts)
+                if count
             },
-            "weighting_counts": dict(weighting_counts),
-            "weighting_percentages": weighting_percentages,
             "never_selected": [
-                self.schemes[scheme_id]
-                for scheme_id in self.schemes
-                if scheme_id not in scheme_counts
+                self.schemes[SCHEME_KEYS[idx]]
+                for idx, count in enumerate(scheme_counts)
+                if count == 0
             ],
         }
 
         # write the summary data to a JSON file
-        with open(filename, "w") as f:
-            json.dump(summary_data, f, indent=4)
+        _dump_json(filename, summary_data)
 
         print(f"\nDetailed simulation results saved to {filename}")
 
@@ -315,6 +484,17 @@ def main():
     parser.add_argument(
         "--trials", type=int, default=1000, help="Number of simulation trials to run"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for large runs (default: all CPU cores)",
+    )
+    parser.add_argument(
+        "--save-trials",
+        action="store_true",
+        help="Stream per-trial outcomes to an .ndjson file",
+    )
     args = parser.parse_args()
 
     # check if all required files exist
@@ -334,7 +514,9 @@ def main():
         return 1
 
     print(f"Starting Monte Carlo simulation with {args.trials} trials...")
-    simulation = DKIMonteCarloSimulation(num_trials=args.trials)
+    simulation = DKIMonteCarloSimulation(
+        num_trials=args.trials, workers=args.workers, save_trials=args.save_trials
+    )
     simulation.run_simulation()
 
     return 0